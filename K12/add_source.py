@@ -68,7 +68,31 @@ class DataSourceManager:
         conn.commit()
         conn.close()
         return data_source
-    
+
+    def record_validation(self, name: str, passed: bool, summary: Dict[str, Any]) -> bool:
+        conn = sqlite3.connect(self.db_path)
+        cursor = conn.cursor()
+        cursor.execute('SELECT metadata FROM data_sources WHERE name = ?', (name,))
+        row = cursor.fetchone()
+        if row is None:
+            conn.close()
+            return False
+
+        metadata = {}
+        if row[0]:
+            try:
+                metadata = json.loads(row[0])
+            except json.JSONDecodeError:
+                pass
+        metadata['validation'] = summary
+
+        cursor.execute('''
+            UPDATE data_sources SET status = ?, metadata = ? WHERE name = ?
+        ''', ('success' if passed else 'failed', json.dumps(metadata), name))
+        conn.commit()
+        conn.close()
+        return True
+
     def list_sources(self) -> List[DataSource]:
         conn = sqlite3.connect(self.db_path)
         cursor = conn.cursor()
@@ -0,0 +1,56 @@
+import pandas as pd
+import pytest
+
+from validation import ColumnRule, DatasetRules, Validator, validate
+
+
+def test_composite_key_duplicate_across_chunks():
+    rules = DatasetRules('composite', unique=['state', 'group'])
+    chunk1 = pd.DataFrame({'state': ['AL', 'AL'], 'group': ['Black', 'White']})
+    chunk2 = pd.DataFrame({'state': ['AL', 'AK'], 'group': ['Black', 'Black']}, index=[2, 3])
+
+    report = validate([chunk1, chunk2], rules)
+
+    assert report.summary()['violations'] == {'state, group:duplicate': 1}
+    assert report.violations['examples'].tolist() == [[2]]
+
+
+def test_report_is_repeatable():
+    rules = DatasetRules('repeat', columns={'n': ColumnRule(dtype='number')},
+                         unique=['state'], suppression_markers=['~'])
+    validator = Validator(rules)
+    validator.check(pd.DataFrame({'state': ['AL', 'AL'], 'n': ['~', '1']}))
+
+    first = validator.report()
+    second = validator.report()
+    assert first.summary()['violations'] == second.summary()['violations'] == {'state:duplicate': 1}
+    assert first.violations['examples'].tolist() == second.violations['examples'].tolist()
+
+    # a later chunk must not change a report that was already handed out
+    validator.check(pd.DataFrame({'state': ['AK'], 'n': ['~']}, index=[2]))
+    assert first.suppressed['n'] == 1
+    assert validator.report().suppressed['n'] == 2
+
+
+def test_blank_keys_are_missing_not_duplicate():
+    rules = DatasetRules('blank', columns={'full code': ColumnRule(required=True)}, unique=['full code'])
+    df = pd.DataFrame({'full code': ['1-701', None, None]})
+
+    report = validate(df, rules)
+
+    assert report.summary()['violations'] == {'full code:missing': 2}
+
+
+def test_missing_unique_column_fails():
+    rules = DatasetRules('no key', unique=['full code'])
+    df = pd.DataFrame({'code': [1, 1]})
+
+    report = validate(df, rules)
+
+    assert not report.passed
+    assert report.summary()['violations'] == {'full code:missing_column': 2}
+
+
+def test_unknown_dtype_raises():
+    with pytest.raises(ValueError):
+        Validator(DatasetRules('typo', columns={'n': ColumnRule(dtype='int')}))
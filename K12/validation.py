@@ -0,0 +1,287 @@
+import datetime
+from dataclasses import dataclass, field
+from typing import Optional, Dict, Any, List, Iterable, Union
+
+import pandas as pd
+
+
+ALL_STATES = [
+    'Alabama', 'Alaska', 'Arizona', 'Arkansas', 'California', 'Colorado', 'Connecticut',
+    'Delaware', 'District of Columbia', 'Florida', 'Georgia', 'Hawaii', 'Idaho', 'Illinois',
+    'Indiana', 'Iowa', 'Kansas', 'Kentucky', 'Louisiana', 'Maine', 'Maryland', 'Massachusetts',
+    'Michigan', 'Minnesota', 'Mississippi', 'Missouri', 'Montana', 'Nebraska', 'Nevada',
+    'New Hampshire', 'New Jersey', 'New Mexico', 'New York', 'North Carolina', 'North Dakota',
+    'Ohio', 'Oklahoma', 'Oregon', 'Pennsylvania', 'Rhode Island', 'South Carolina',
+    'South Dakota', 'Tennessee', 'Texas', 'Utah', 'Vermont', 'Virginia', 'Washington',
+    'West Virginia', 'Wisconsin', 'Wyoming',
+]
+
+# how many offending row labels to keep per check in the report
+MAX_EXAMPLES = 5
+
+
+@dataclass
+class ColumnRule:
+    dtype: Optional[str] = None  # 'number' or 'integer'
+    min: Optional[float] = None
+    max: Optional[float] = None
+    required: bool = False
+
+
+@dataclass
+class DatasetRules:
+    name: str
+    columns: Dict[str, ColumnRule] = field(default_factory=dict)
+    unique: Optional[List[str]] = None
+    state_column: Optional[str] = None
+    states: List[str] = field(default_factory=lambda: list(ALL_STATES))
+    suppression_markers: List[str] = field(default_factory=list)
+
+
+@dataclass
+class ValidationReport:
+    dataset: str
+    rows: int
+    violations: pd.DataFrame
+    missing_states: List[str]
+    suppressed: Dict[str, int]
+    checked_at: datetime.datetime = field(default_factory=datetime.datetime.now)
+
+    @property
+    def passed(self) -> bool:
+        return self.violations.empty and not self.missing_states
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            'passed': self.passed,
+            'checked_at': self.checked_at.isoformat(timespec='seconds'),
+            'rows': self.rows,
+            'violations': {f'{r.column}:{r.check}': int(r.count) for r in self.violations.itertuples()},
+            'missing_states': self.missing_states,
+            'suppressed': self.suppressed,
+        }
+
+    def __str__(self) -> str:
+        status = 'PASS' if self.passed else 'FAIL'
+        lines = [f'{self.dataset}: {status} ({self.rows} rows)']
+        for r in self.violations.itertuples():
+            lines.append(f'  {r.column} {r.check}: {r.count} rows, e.g. {r.examples}')
+        if self.missing_states:
+            lines.append(f'  missing states: {", ".join(self.missing_states)}')
+        suppressed = {k: v for k, v in self.suppressed.items() if v}
+        if suppressed:
+            lines.append(f'  suppressed cells: {suppressed}')
+        return '\n'.join(lines)
+
+
+class Validator:
+    """
+    Compiled form of a DatasetRules. Feed it one frame or many chunks with
+    check(), then call report(). Each check is a vectorized mask over the
+    chunk so every row is only visited once.
+    """
+
+    def __init__(self, rules: DatasetRules):
+        self.rules = rules
+        self.checks = self._compile()
+        self.rows = 0
+        self.counts: Dict[tuple, int] = {}
+        self.examples: Dict[tuple, list] = {}
+        self.suppressed = {col: 0 for col in rules.columns}
+        self.states_seen = set()
+        # one uint64 hash per row with a complete key, kept per chunk
+        self.keys: List[pd.Series] = []
+
+    def _compile(self):
+        checks = []
+        for col, rule in self.rules.columns.items():
+            if rule.dtype not in (None, 'number', 'integer'):
+                raise ValueError(f"{self.rules.name}: unknown dtype {rule.dtype!r} for column {col!r}")
+            if rule.required:
+                checks.append((col, 'missing', lambda raw, num: raw.isna()))
+            if rule.dtype in ('number', 'integer'):
+                checks.append((col, 'not_numeric', lambda raw, num: num.isna() & raw.notna()))
+            if rule.dtype == 'integer':
+                checks.append((col, 'not_integer', lambda raw, num: num.notna() & (num % 1 != 0)))
+            if rule.min is not None:
+                checks.append((col, f'below_{rule.min:g}', lambda raw, num, lo=rule.min: num < lo))
+            if rule.max is not None:
+                checks.append((col, f'above_{rule.max:g}', lambda raw, num, hi=rule.max: num > hi))
+        return checks
+
+    def _add(self, key: tuple, mask: pd.Series, counts=None, examples=None):
+        counts = self.counts if counts is None else counts
+        examples = self.examples if examples is None else examples
+        count = int(mask.sum())
+        if not count:
+            return
+        counts[key] = counts.get(key, 0) + count
+        examples = examples.setdefault(key, [])
+        if len(examples) < MAX_EXAMPLES:
+            examples.extend(mask.index[mask.to_numpy()][:MAX_EXAMPLES - len(examples)].tolist())
+
+    def check(self, chunk: pd.DataFrame):
+        self.rows += len(chunk)
+        markers = self.rules.suppression_markers
+
+        cleaned = {}
+        for col, rule in self.rules.columns.items():
+            if col not in chunk.columns:
+                key = (col, 'missing_column')
+                self.counts[key] = self.counts.get(key, 0) + len(chunk)
+                continue
+            raw = chunk[col]
+            if markers:
+                suppressed = raw.isin(markers)
+                self.suppressed[col] += int(suppressed.sum())
+                raw = raw.mask(suppressed)
+            if rule.dtype in ('number', 'integer') or rule.min is not None or rule.max is not None:
+                num = pd.to_numeric(raw, errors='coerce')
+            else:
+                num = raw
+            cleaned[col] = (raw, num)
+
+        for col, name, fn in self.checks:
+            if col not in cleaned:
+                continue
+            raw, num = cleaned[col]
+            self._add((col, name), fn(raw, num))
+
+        if self.rules.unique:
+            missing = [c for c in self.rules.unique if c not in chunk.columns]
+            for col in missing:
+                # columns with their own rule were already counted above
+                if col not in self.rules.columns:
+                    key = (col, 'missing_column')
+                    self.counts[key] = self.counts.get(key, 0) + len(chunk)
+            if not missing:
+                # blank keys are left to the required rule
+                key = chunk[self.rules.unique].dropna()
+                self.keys.append(pd.util.hash_pandas_object(key, index=False))
+
+        state_col = self.rules.state_column
+        if state_col and state_col in chunk.columns:
+            self.states_seen.update(chunk[state_col].dropna().astype(str).str.strip().unique())
+
+    def report(self) -> ValidationReport:
+        # uniqueness has to look across chunks, so it is settled at the end on
+        # copies of the tallies so report() can be called more than once
+        counts = dict(self.counts)
+        examples = {key: list(rows) for key, rows in self.examples.items()}
+        if self.keys:
+            keys = pd.concat(self.keys)
+            self._add((', '.join(self.rules.unique), 'duplicate'), keys.duplicated(keep='first'),
+                      counts, examples)
+
+        records = [
+            {'column': col, 'check': name, 'count': count,
+             'examples': examples.get((col, name), [])}
+            for (col, name), count in counts.items()
+        ]
+        violations = pd.DataFrame(records, columns=['column', 'check', 'count', 'examples'])
+
+        missing_states = []
+        if self.rules.state_column:
+            missing_states = sorted(set(self.rules.states) - self.states_seen)
+
+        return ValidationReport(
+            dataset=self.rules.name,
+            rows=self.rows,
+            violations=violations,
+            missing_states=missing_states,
+            suppressed=dict(self.suppressed),
+        )
+
+
+def validate(data: Union[pd.DataFrame, Iterable[pd.DataFrame]], rules: DatasetRules) -> ValidationReport:
+    """
+    Runs rules over a DataFrame or an iterable of chunks
+    (e.g. pd.read_csv(..., chunksize=...)) and returns the report.
+    """
+    validator = Validator(rules)
+    chunks = [data] if isinstance(data, pd.DataFrame) else data
+    for chunk in chunks:
+        validator.check(chunk)
+    return validator.report()
+
+
+def validate_file(path, rules: DatasetRules, chunksize: int = 500_000, **read_kwargs) -> ValidationReport:
+    """
+    Streams a csv through the rules chunk by chunk.
+    Everything is read as text so suppression markers survive.
+    """
+    read_kwargs.setdefault('dtype', str)
+    return validate(pd.read_csv(path, chunksize=chunksize, **read_kwargs), rules)
+
+
+def record_result(report: ValidationReport, manager=None) -> bool:
+    """
+    Stores pass/fail on the DataSource row with the same name as the rules.
+    Returns False if there is no such row.
+    """
+    if manager is None:
+        from add_source import manager
+    return manager.record_validation(report.dataset, report.passed, report.summary())
+
+
+# rules for the inputs we already pull
+PERCENT = ColumnRule(dtype='number', min=0, max=100)
+COUNT = ColumnRule(dtype='integer', min=0)
+
+ACT_RULES = DatasetRules(
+    name='act_2024',
+    columns={
+        'state': ColumnRule(required=True),
+        'est_percent_grads_tested': PERCENT,
+        'avg_composite_score': ColumnRule(dtype='number', min=1, max=36),
+        'eng_benchmark_percent': PERCENT,
+        'math_benchmark_percent': PERCENT,
+        'reading_benchmark_percent': PERCENT,
+        'sci_benchmark_percent': PERCENT,
+    },
+    unique=['state'],
+    state_column='state',
+)
+
+DEMOGRAPHICS_RULES = DatasetRules(
+    name='demographics_2024_al',
+    columns={
+        'Total Student Count': COUNT,
+        'Asian': COUNT,
+        'Asian %': PERCENT,
+        'Black or African American': COUNT,
+        'Black or African American %': PERCENT,
+        'American Indian / Alaska Native': COUNT,
+        ' American Indian / Alaska Native %': PERCENT,
+        'Native Hawaiian / Pacific Islander': COUNT,
+        'Native Hawaiian / Pacific Islander %': PERCENT,
+        'White': COUNT,
+        'White %': PERCENT,
+        'Two or more races': COUNT,
+        'Two or more races %': PERCENT,
+    },
+    suppression_markers=['~', '*'],
+)
+
+VA_ELN_RULES = DatasetRules(
+    name='va_eln_schools',
+    columns={
+        'full code': ColumnRule(required=True),
+        'code': COUNT,
+        'div num': COUNT,
+    },
+    unique=['full code'],
+)
+
+
+if __name__ == "__main__":
+    from pathlib import Path
+    here = Path(__file__).parent
+
+    report = validate_file(here / 'Dec Data Packet' / 'Data Sources' / 'data_collection' / 'demographics_2024_al.csv',
+                           DEMOGRAPHICS_RULES)
+    print(report)
+
+    report = validate_file(here.parent / 'VA ELN' / 'eln_schools.csv', VA_ELN_RULES)
+    print(report)
+
@@ -0,0 +1,220 @@
+import re
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import pandas as pd
+
+
+# words that show up in almost every school name and carry no signal
+STOP_WORDS = {'school', 'the', 'of', 'for', 'and'}
+
+
+def normalize_name(name: str) -> str:
+    """
+    Lowercases a school name and strips punctuation and filler words.
+    """
+    name = re.sub(r'[^a-z0-9 ]', ' ', str(name).lower())
+    words = [w for w in name.split() if w not in STOP_WORDS]
+    return ' '.join(words)
+
+
+def char_ngrams(name: str, n: int = 3) -> set:
+    """
+    Returns the set of character n-grams for an already normalized name.
+    Each word is padded so short words still produce grams.
+    """
+    grams = set()
+    for word in name.split():
+        padded = f' {word} '
+        if len(padded) <= n:
+            grams.add(padded)
+            continue
+        for i in range(len(padded) - n + 1):
+            grams.add(padded[i:i + n])
+    return grams
+
+
+class SchoolNameIndex:
+    """
+    Character n-gram index over school names, blocked by division number.
+
+    Building the index is linear in the total number of grams. A lookup only
+    walks the posting lists for the query's grams inside one division, so
+    matching a list of names is near-linear instead of all-pairs.
+    """
+
+    def __init__(self, schools: pd.DataFrame, n: int = 3,
+                 code_col: str = 'full code',
+                 name_col: str = 'School Name',
+                 division_col: str = 'Division Number',
+                 division_name_col: str = 'Division Name'):
+        self.n = n
+        self.codes: List[str] = []
+        self.gram_counts: List[int] = []
+        self.name_by_code: Dict[str, str] = {}
+        # df_all pads division names with trailing spaces
+        divisions = schools[[division_name_col, division_col]].drop_duplicates()
+        self.division_by_name: Dict[str, int] = {
+            str(name).strip().lower(): int(number)
+            for name, number in zip(divisions[division_name_col], divisions[division_col])
+        }
+        # division -> gram -> positions in self.codes
+        self.blocks: Dict[int, Dict[str, List[int]]] = defaultdict(lambda: defaultdict(list))
+
+        schools = schools.drop_duplicates(subset=code_col)
+        for code, name, division in zip(schools[code_col], schools[name_col], schools[division_col]):
+            grams = char_ngrams(normalize_name(name), n)
+            pos = len(self.codes)
+            self.codes.append(code)
+            self.name_by_code[code] = name
+            self.gram_counts.append(len(grams))
+            postings = self.blocks[int(division)]
+            for gram in grams:
+                postings[gram].append(pos)
+
+    def match(self, partial_name: str, division: Optional[int] = None,
+              top_n: int = 5) -> List[Tuple[str, float]]:
+        """
+        Returns up to top_n (full code, score) pairs ranked best first.
+
+        The score is the share of the query's grams found in the candidate
+        (so truncated names like "field Elementary" still score high), with
+        the Dice coefficient used to break ties toward the closer name.
+        If division is None every division is searched. A blank name
+        returns no candidates.
+        """
+        if pd.isna(partial_name):
+            return []
+        grams = char_ngrams(normalize_name(partial_name), self.n)
+        if not grams:
+            return []
+
+        if division is None:
+            blocks = list(self.blocks.values())
+        else:
+            blocks = [self.blocks.get(int(division), {})]
+
+        shared = defaultdict(int)
+        for postings in blocks:
+            for gram in grams:
+                for pos in postings.get(gram, ()):
+                    shared[pos] += 1
+
+        scored = []
+        for pos, hits in shared.items():
+            containment = hits / len(grams)
+            dice = 2 * hits / (len(grams) + self.gram_counts[pos])
+            scored.append((containment, dice, pos))
+        scored.sort(reverse=True)
+
+        return [(self.codes[pos], round(containment, 4)) for containment, _, pos in scored[:top_n]]
+
+    def division_number(self, division_name: str) -> Optional[int]:
+        """
+        Looks up a division number from its name, e.g. "Danville City".
+        Returns None for names not in the index.
+        """
+        if pd.isna(division_name):
+            return None
+        return self.division_by_name.get(str(division_name).strip().lower())
+
+
+def match_schools(index: SchoolNameIndex, df: pd.DataFrame,
+                  name_col: str = 'School- school',
+                  division_col: str = 'School Division',
+                  division_number_col: Optional[str] = None,
+                  top_n: int = 5) -> pd.DataFrame:
+    """
+    Matches every row of df against the index and returns one row per
+    candidate with its rank and score.
+
+    The block is found from the division name in division_col. Pass
+    division_number_col (e.g. 'div num') to use a known division number
+    instead. Rows whose division can't be resolved fall back to searching
+    every division, which is a full statewide scan and much slower (see
+    benchmark()).
+    """
+    if division_number_col is None:
+        divisions = [index.division_number(name) for name in df[division_col]]
+    else:
+        divisions = [None if pd.isna(d) else int(d) for d in df[division_number_col]]
+
+    rows = []
+    for idx, name, division in zip(df.index, df[name_col], divisions):
+        for rank, (code, score) in enumerate(index.match(name, division, top_n), start=1):
+            rows.append({
+                'row': idx,
+                name_col: name,
+                'candidate code': code,
+                'candidate name': index.name_by_code[code],
+                'rank': rank,
+                'score': score,
+            })
+    return pd.DataFrame(rows, columns=['row', name_col, 'candidate code', 'candidate name', 'rank', 'score'])
+
+
+def benchmark(df_all: pd.DataFrame, eln: pd.DataFrame, top_n: int = 5) -> Dict[str, float]:
+    """
+    Scores the matcher against the hand-built full codes in eln_schools.csv
+    and times the index build and lookups. Blocks come from the division
+    name, not div num, since div num is half of the answer.
+
+    The statewide timings match every school in df_all back against the
+    index, once blocked by its own division and once unblocked, which is
+    what rows with an unresolved division cost.
+    """
+    start = time.perf_counter()
+    index = SchoolNameIndex(df_all)
+    build_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    matches = match_schools(index, eln, top_n=top_n)
+    match_time = time.perf_counter() - start
+
+    truth = eln['full code']
+    hits = matches.merge(truth.rename('candidate code').reset_index().rename(columns={'index': 'row'}),
+                         on=['row', 'candidate code'])
+    found_rank = hits.set_index('row')['rank'].reindex(eln.index)
+
+    schools = df_all.drop_duplicates(subset='full code')
+    start = time.perf_counter()
+    for name, division in zip(schools['School Name'], schools['Division Number']):
+        index.match(name, division, top_n)
+    statewide_blocked = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for name in schools['School Name']:
+        index.match(name, None, top_n)
+    statewide_unblocked = time.perf_counter() - start
+
+    return {
+        'schools indexed': len(index.codes),
+        'names matched': len(eln),
+        'unresolved divisions': int(sum(index.division_number(d) is None for d in eln['School Division'])),
+        'top1 accuracy': float((found_rank == 1).mean()),
+        f'top{top_n} accuracy': float(found_rank.notna().mean()),
+        'build seconds': round(build_time, 4),
+        'match seconds': round(match_time, 4),
+        'statewide blocked seconds': round(statewide_blocked, 4),
+        'statewide unblocked seconds': round(statewide_unblocked, 4),
+    }
+
+
+if __name__ == "__main__":
+    folder = Path(__file__).parent
+    df_all = pd.read_csv(folder / 'df_all.csv', dtype={'full code': str})
+    eln = pd.read_csv(folder / 'eln_schools.csv', dtype={'full code': str})
+
+    results = benchmark(df_all, eln)
+    for key, value in results.items():
+        print(f'{key}: {value}')
+
+    # same lookup with blocking turned off, to show what the division block buys
+    index = SchoolNameIndex(df_all)
+    start = time.perf_counter()
+    top = [index.match(name, top_n=1) for name in eln['School- school']]
+    print(f'unblocked match seconds: {round(time.perf_counter() - start, 4)}')
+    correct = [bool(t) and t[0][0] == code for t, code in zip(top, eln['full code'])]
+    print(f'unblocked top1 accuracy: {round(sum(correct) / len(correct), 4)}')